@@ -91,9 +91,25 @@ impl Config {
     /// is merged in, so a malformed or type-invalid file is skipped (with a
     /// warning on stderr) and does not poison the other file's values.
     fn load_layered(global: Option<&Path>, local: Option<&Path>) -> Self {
+        // A missing file is silent (expected), so it simply contributes no layer
+        let layers: Vec<(&Path, String)> = [global, local]
+            .into_iter()
+            .flatten()
+            .filter_map(|path| Some((path, std::fs::read_to_string(path).ok()?)))
+            .collect();
+        Self::merge_layers(
+            layers
+                .iter()
+                .map(|(path, contents)| (*path, contents.as_str())),
+        )
+    }
+
+    /// Merge already-read config sources in precedence order (later wins).
+    /// `path` is only used to label warnings.
+    fn merge_layers<'a>(layers: impl IntoIterator<Item = (&'a Path, &'a str)>) -> Self {
         let mut merged = toml::Table::new();
-        for path in [global, local].into_iter().flatten() {
-            if let Some(table) = load_valid_config_table(path) {
+        for (path, contents) in layers {
+            if let Some(table) = parse_valid_config_table(path, contents) {
                 deep_merge_tables(&mut merged, table);
             }
         }
@@ -134,13 +150,12 @@ fn deep_merge_tables(base: &mut toml::Table, overlay: toml::Table) {
     }
 }
 
-/// Read one config file and return its parsed `toml::Table` only if it
-/// both parses as TOML and deserializes cleanly into `Config`. A missing
-/// file is silent (expected); a malformed file logs a warning and returns
-/// `None` so the other layer remains intact.
-fn load_valid_config_table(path: &Path) -> Option<toml::Table> {
-    let contents = std::fs::read_to_string(path).ok()?;
-    let table: toml::Table = match toml::from_str(&contents) {
+/// Parse one config file's contents and return its `toml::Table` only if
+/// it both parses as TOML and deserializes cleanly into `Config`. A
+/// malformed file logs a warning and returns `None` so the other layer
+/// remains intact.
+fn parse_valid_config_table(path: &Path, contents: &str) -> Option<toml::Table> {
+    let table: toml::Table = match toml::from_str(contents) {
         Ok(table) => table,
         Err(error) => {
             eprintln!(
@@ -369,25 +384,14 @@ panes = 3
     }
 
     #[test]
-    fn test_load_layered_local_overrides_scalar() {
-        use std::io::Write;
-
-        let dir = tempfile::tempdir().unwrap();
-        let global = dir.path().join("global.toml");
-        let local = dir.path().join("local.toml");
-
-        writeln!(
-            std::fs::File::create(&global).unwrap(),
-            "[session]\npanes = 2\nagent_cmd = \"aider\"\n"
-        )
-        .unwrap();
-        writeln!(
-            std::fs::File::create(&local).unwrap(),
-            "[session]\npanes = 3\n"
-        )
-        .unwrap();
-
-        let config = Config::load_layered(Some(&global), Some(&local));
+    fn test_merge_layers_local_overrides_scalar() {
+        let config = Config::merge_layers([
+            (
+                Path::new("global.toml"),
+                "[session]\npanes = 2\nagent_cmd = \"aider\"\n",
+            ),
+            (Path::new("local.toml"), "[session]\npanes = 3\n"),
+        ]);
         assert_eq!(config.session.panes, 3);
         assert_eq!(config.session.agent_cmd, "aider");
     }
@@ -401,73 +405,37 @@ panes = 3
     }
 
     #[test]
-    fn test_load_layered_invalid_local_preserves_global() {
-        use std::io::Write;
-
-        let dir = tempfile::tempdir().unwrap();
-        let global = dir.path().join("global.toml");
-        let local = dir.path().join("local.toml");
-
-        writeln!(
-            std::fs::File::create(&global).unwrap(),
-            "[session]\nagent_cmd = \"aider\"\npanes = 3\n"
-        )
-        .unwrap();
-        writeln!(
-            std::fs::File::create(&local).unwrap(),
-            "[session]\npanes = \"two\"\n"
-        )
-        .unwrap();
-
-        let config = Config::load_layered(Some(&global), Some(&local));
+    fn test_merge_layers_invalid_local_preserves_global() {
+        let config = Config::merge_layers([
+            (
+                Path::new("global.toml"),
+                "[session]\nagent_cmd = \"aider\"\npanes = 3\n",
+            ),
+            (Path::new("local.toml"), "[session]\npanes = \"two\"\n"),
+        ]);
         assert_eq!(config.session.agent_cmd, "aider");
         assert_eq!(config.session.panes, 3);
     }
 
     #[test]
-    fn test_load_layered_invalid_global_preserves_local() {
-        use std::io::Write;
-
-        let dir = tempfile::tempdir().unwrap();
-        let global = dir.path().join("global.toml");
-        let local = dir.path().join("local.toml");
-
-        writeln!(
-            std::fs::File::create(&global).unwrap(),
-            "[session]\nmode = \"invalid\"\n"
-        )
-        .unwrap();
-        writeln!(
-            std::fs::File::create(&local).unwrap(),
-            "[session]\nagent_cmd = \"aider\"\n"
-        )
-        .unwrap();
-
-        let config = Config::load_layered(Some(&global), Some(&local));
+    fn test_merge_layers_invalid_global_preserves_local() {
+        let config = Config::merge_layers([
+            (Path::new("global.toml"), "[session]\nmode = \"invalid\"\n"),
+            (
+                Path::new("local.toml"),
+                "[session]\nagent_cmd = \"aider\"\n",
+            ),
+        ]);
         assert_eq!(config.session.agent_cmd, "aider");
         assert_eq!(config.session.mode, SessionMode::Panes);
     }
 
     #[test]
-    fn test_load_layered_both_invalid_returns_defaults() {
-        use std::io::Write;
-
-        let dir = tempfile::tempdir().unwrap();
-        let global = dir.path().join("global.toml");
-        let local = dir.path().join("local.toml");
-
-        writeln!(
-            std::fs::File::create(&global).unwrap(),
-            "[session]\npanes = \"two\"\n"
-        )
-        .unwrap();
-        writeln!(
-            std::fs::File::create(&local).unwrap(),
-            "[session]\nmode = \"invalid\"\n"
-        )
-        .unwrap();
-
-        let config = Config::load_layered(Some(&global), Some(&local));
+    fn test_merge_layers_both_invalid_returns_defaults() {
+        let config = Config::merge_layers([
+            (Path::new("global.toml"), "[session]\npanes = \"two\"\n"),
+            (Path::new("local.toml"), "[session]\nmode = \"invalid\"\n"),
+        ]);
         assert_eq!(config.session.mode, SessionMode::Panes);
         assert_eq!(config.session.panes, 2);
         assert_eq!(config.session.agent_cmd, "claude");
@@ -3,3 +3,9 @@ pub mod session;
 pub mod shell;
 pub mod tmux_manager;
 pub mod worktree_manager;
+
+// Unit tests share the integration tests' repo fixtures rather than keeping
+// copies
+#[cfg(test)]
+#[path = "../tests/common/repo.rs"]
+mod test_repo;
@@ -4,13 +4,13 @@ use anyhow::{Context, Result};
 use clap::{Parser, Subcommand};
 use dialoguer::Select;
 use std::path::{Path, PathBuf};
-use std::process::Command;
+use std::process::{Command, Stdio};
 
 use session_cmd::{run_session, SessionAction};
 use wt::config::SessionMode;
 use wt::shell::spawn_wt_shell;
 use wt::worktree_manager::{
-    check_not_in_worktree, ensure_worktrees_in_gitignore, get_current_worktree_name,
+    check_not_in_worktree, ensure_worktrees_in_gitignore, get_current_worktree_name, WorktreeInfo,
     WorktreeManager,
 };
 
@@ -124,8 +124,10 @@ fn get_root_branch() -> String {
     for branch in ["main", "master"] {
         if Command::new("git")
             .args(["rev-parse", "--verify", branch])
-            .output()
-            .map(|o| o.status.success())
+            .stdout(Stdio::null())
+            .stderr(Stdio::null())
+            .status()
+            .map(|status| status.success())
             .unwrap_or(false)
         {
             return branch.to_string();
@@ -137,27 +139,37 @@ fn get_root_branch() -> String {
 
 fn main() -> Result<()> {
     let cli = Cli::parse();
-    let config = RepoConfig::new(&cli.dir)?;
+    // Resolved per command so `which` doesn't pay for repo root discovery
+    let config = || RepoConfig::new(&cli.dir);
 
     match cli.command {
         Commands::New {
             name,
             b,
             print_path,
-        } => cmd_new(&config, name, &b, print_path),
-        Commands::Use { name } => cmd_use(&config, name),
-        Commands::Ls => cmd_ls(&config),
-        Commands::Rm { name } => cmd_rm(&config, name),
-        Commands::Which => cmd_which(&config.root),
-        Commands::Session { mode, action } => run_session(&config, mode, action),
+        } => cmd_new(&config()?, name, &b, print_path),
+        Commands::Use { name } => cmd_use(&config()?, name),
+        Commands::Ls => cmd_ls(&config()?),
+        Commands::Rm { name } => cmd_rm(&config()?, name),
+        Commands::Which => cmd_which(Path::new(".")),
+        Commands::Session { mode, action } => run_session(&config()?, mode, action),
     }
 }
 
 fn cmd_new(config: &RepoConfig, name: Option<String>, base: &str, print_path: bool) -> Result<()> {
     check_not_in_worktree(&config.root)?;
 
-    let current_branch = get_current_branch()?;
-    let root_branch = get_root_branch();
+    // Independent git lookups; resolve the root branch (up to three git
+    // calls) while the current branch is being read.
+    let (current_branch, root_branch) = std::thread::scope(|scope| {
+        let root_branch = scope.spawn(get_root_branch);
+        let current_branch = get_current_branch();
+        let root_branch = root_branch
+            .join()
+            .unwrap_or_else(|payload| std::panic::resume_unwind(payload));
+        (current_branch, root_branch)
+    });
+    let current_branch = current_branch?;
 
     let name = match name {
         Some(n) => n,
@@ -279,14 +291,13 @@ fn migrate_from_current_branch(repo_path: &Path, root_branch: &str) -> Result<bo
 }
 
 enum PickResult {
-    Selected(String),
+    Selected(WorktreeInfo),
     ExitShell,
     Cancelled,
     Empty,
 }
 
-fn pick_worktree(config: &RepoConfig, prompt: &str) -> Result<PickResult> {
-    let manager = WorktreeManager::new(config.root.clone())?;
+fn pick_worktree(manager: &WorktreeManager, prompt: &str) -> Result<PickResult> {
     let worktrees = manager.list_worktrees()?;
 
     let in_wt_shell = std::env::var("WT_ACTIVE").is_ok();
@@ -333,31 +344,33 @@ fn pick_worktree(config: &RepoConfig, prompt: &str) -> Result<PickResult> {
         items.push("← cancel".to_string());
     }
 
-    let default = if let Some(ref name) = current_wt {
-        items.iter().position(|i| i.starts_with(name)).unwrap_or(0)
-    } else {
-        0
-    };
+    let default = default_pick_index(&wt_list, current_wt.as_deref());
 
     eprintln!("{}", prompt);
     let selection = Select::new().items(&items).default(default).interact()?;
 
-    let selected = &items[selection];
-
-    if selected == "← exit shell" {
-        return Ok(PickResult::ExitShell);
-    }
-
-    if selected == "← cancel" {
-        return Ok(PickResult::Cancelled);
+    // Hand back the listed entry so callers don't have to list worktrees
+    // again to resolve the name
+    match wt_list.get(selection) {
+        Some(wt) => Ok(PickResult::Selected((*wt).clone())),
+        None if in_wt_shell => Ok(PickResult::ExitShell),
+        None => Ok(PickResult::Cancelled),
     }
+}
 
-    let wt_name = selected.trim_end_matches(" *").to_string();
-    Ok(PickResult::Selected(wt_name))
+/// Index of the current worktree in the picker list, or 0 when it isn't listed.
+/// Matches on the task id itself rather than prefix-matching rendered labels,
+/// which could land on a longer name that sorts first.
+fn default_pick_index(worktrees: &[&WorktreeInfo], current: Option<&str>) -> usize {
+    worktrees
+        .iter()
+        .position(|wt| Some(wt.task_id.as_str()) == current)
+        .unwrap_or(0)
 }
 
 fn cmd_ls(config: &RepoConfig) -> Result<()> {
-    match pick_worktree(config, "Select worktree:")? {
+    let manager = WorktreeManager::new(config.root.clone())?;
+    match pick_worktree(&manager, "Select worktree:")? {
         PickResult::Empty => {
             eprintln!("No worktrees found.");
         }
@@ -365,11 +378,7 @@ fn cmd_ls(config: &RepoConfig) -> Result<()> {
             eprintln!("Type 'exit' to leave this worktree shell.");
         }
         PickResult::Cancelled => {}
-        PickResult::Selected(name) => {
-            let manager = WorktreeManager::new(config.root.clone())?;
-            let wt_info = manager
-                .get_worktree_info(&name)?
-                .ok_or_else(|| anyhow::anyhow!("Worktree not found"))?;
+        PickResult::Selected(wt_info) => {
             spawn_wt_shell(&wt_info.path, &wt_info.task_id, &wt_info.branch)?;
         }
     }
@@ -377,10 +386,17 @@ fn cmd_ls(config: &RepoConfig) -> Result<()> {
 }
 
 fn cmd_rm(config: &RepoConfig, name: Option<String>) -> Result<()> {
+    let manager = WorktreeManager::new(config.root.clone())?;
     let name = match name {
-        Some(n) => n,
-        None => match pick_worktree(config, "Remove worktree:")? {
-            PickResult::Selected(n) => n,
+        Some(n) => {
+            manager.remove_worktree(&n)?;
+            n
+        }
+        None => match pick_worktree(&manager, "Remove worktree:")? {
+            PickResult::Selected(wt_info) => {
+                manager.remove_worktree_entry(&wt_info)?;
+                wt_info.task_id
+            }
             PickResult::Empty => {
                 eprintln!("No worktrees found.");
                 return Ok(());
@@ -389,8 +405,6 @@ fn cmd_rm(config: &RepoConfig, name: Option<String>) -> Result<()> {
         },
     };
 
-    let manager = WorktreeManager::new(config.root.clone())?;
-    manager.remove_worktree(&name)?;
     eprintln!("Removed worktree: {}", name);
     Ok(())
 }
@@ -424,3 +438,31 @@ fn cmd_use(config: &RepoConfig, name: Option<String>) -> Result<()> {
     spawn_wt_shell(&wt_info.path, &wt_info.task_id, &wt_info.branch)?;
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn worktree(task_id: &str) -> WorktreeInfo {
+        WorktreeInfo {
+            task_id: task_id.to_string(),
+            path: PathBuf::from("/wt").join(task_id),
+            branch: task_id.to_string(),
+        }
+    }
+
+    #[test]
+    fn test_default_pick_index_skips_longer_name_with_same_prefix() {
+        let (longer, exact) = (worktree("foo-2"), worktree("foo"));
+
+        assert_eq!(default_pick_index(&[&longer, &exact], Some("foo")), 1);
+    }
+
+    #[test]
+    fn test_default_pick_index_without_current_is_first() {
+        let (a, b) = (worktree("a"), worktree("b"));
+
+        assert_eq!(default_pick_index(&[&a, &b], None), 0);
+        assert_eq!(default_pick_index(&[&a, &b], Some("missing")), 0);
+    }
+}
@@ -1,6 +1,8 @@
 use anyhow::{Context, Result};
 use serde::{Deserialize, Serialize};
 use std::collections::{HashMap, HashSet};
+use std::fs::File;
+use std::io::{BufWriter, ErrorKind, Write};
 use std::path::PathBuf;
 
 use crate::config::Config;
@@ -47,13 +49,16 @@ impl SessionState {
     /// Load session state from ~/.wt/sessions.json
     pub fn load() -> Result<Option<Self>> {
         let path = Self::state_file_path()?;
-        if !path.exists() {
-            return Ok(None);
-        }
 
-        let contents = std::fs::read_to_string(&path).context("Failed to read sessions.json")?;
+        // serde_json validates UTF-8 as it parses, so skip the separate
+        // String decode pass
+        let contents = match std::fs::read(&path) {
+            Ok(contents) => contents,
+            Err(err) if err.kind() == ErrorKind::NotFound => return Ok(None),
+            Err(err) => return Err(err).context("Failed to read sessions.json"),
+        };
         let state: SessionState =
-            serde_json::from_str(&contents).context("Failed to parse sessions.json")?;
+            serde_json::from_slice(&contents).context("Failed to parse sessions.json")?;
 
         Ok(Some(state))
     }
@@ -61,10 +66,14 @@ impl SessionState {
     /// Save session state to ~/.wt/sessions.json
     pub fn save(&self) -> Result<()> {
         let path = Self::state_file_path()?;
-        let contents =
-            serde_json::to_string_pretty(self).context("Failed to serialize session state")?;
-
-        std::fs::write(&path, contents).context("Failed to write sessions.json")?;
+        let file = File::create(&path).context("Failed to write sessions.json")?;
+
+        // Serialize straight into the file rather than building the whole
+        // document as a String first
+        let mut writer = BufWriter::new(file);
+        serde_json::to_writer_pretty(&mut writer, self)
+            .context("Failed to serialize session state")?;
+        writer.flush().context("Failed to write sessions.json")?;
         Ok(())
     }
 
@@ -98,15 +107,20 @@ impl SessionState {
     /// Sync session state with actual tmux windows.
     pub fn sync_with_tmux(&mut self, tmux: &TmuxManager) -> Result<()> {
         let windows = tmux.list_windows()?;
-        let window_names: HashSet<_> = windows.iter().map(|window| window.name.clone()).collect();
-
-        self.worktrees.retain(|name, _| window_names.contains(name));
-
-        for window in &windows {
-            if let Some(info) = self.worktrees.get_mut(&window.name) {
-                info.pane_count = window.pane_count as u8;
-            }
-        }
+        let pane_counts: HashMap<&str, u32> = windows
+            .iter()
+            .map(|window| (window.name.as_str(), window.pane_count))
+            .collect();
+
+        // Drop closed windows and refresh pane counts in one pass
+        self.worktrees
+            .retain(|name, info| match pane_counts.get(name.as_str()) {
+                Some(&pane_count) => {
+                    info.pane_count = pane_count as u8;
+                    true
+                }
+                None => false,
+            });
 
         Ok(())
     }
@@ -114,10 +128,12 @@ impl SessionState {
     /// Clear the session state file.
     pub fn clear() -> Result<()> {
         let path = Self::state_file_path()?;
-        if path.exists() {
-            std::fs::remove_file(&path).context("Failed to remove sessions.json")?;
+        match std::fs::remove_file(&path) {
+            Err(err) if err.kind() != ErrorKind::NotFound => {
+                Err(err).context("Failed to remove sessions.json")
+            }
+            _ => Ok(()),
         }
-        Ok(())
     }
 
     /// Whether the state holds no panes-mode or windows-mode entries.
@@ -7,7 +7,7 @@ use std::path::{Path, PathBuf};
 use crate::{cmd_ls, RepoConfig};
 use wt::config::{Config, SessionMode};
 use wt::session::{retain_live_sessions, SessionState, WindowsSessionInfo};
-use wt::tmux_manager::{AgentStatus, TmuxManager};
+use wt::tmux_manager::{AgentStatus, TmuxManager, TmuxWindow};
 use wt::worktree_manager::{check_not_in_worktree, ensure_worktrees_in_gitignore, WorktreeManager};
 
 const SESSION_NAME: &str = "wt";
@@ -297,26 +297,28 @@ fn cmd_session_rm_panes(context: &SessionCmdContext<'_>, name: &str) -> Result<(
 
     if !tmux.session_exists()? {
         eprintln!("No session found.");
-        print_rm_hint(SessionMode::Panes, name, &probe_session_rm(context, name)?);
+        let state = SessionState::load()?;
+        let probe = probe_session_rm(context, name, state.as_ref())?;
+        print_rm_hint(SessionMode::Panes, name, &probe);
         return Ok(());
     }
 
     let windows = tmux.list_windows()?;
     if !windows.iter().any(|window| window.name == name) {
         eprintln!("Window '{}' not found in session.", name);
-        print_rm_hint(SessionMode::Panes, name, &probe_session_rm(context, name)?);
+        let state = SessionState::load()?;
+        let probe = probe_session_rm(context, name, state.as_ref())?;
+        print_rm_hint(SessionMode::Panes, name, &probe);
         return Ok(());
     }
 
     tmux.kill_window(name)?;
     eprintln!("Removed window: {}", name);
 
-    let remaining: Vec<_> = tmux
+    let session_drained = tmux
         .list_windows()?
-        .into_iter()
-        .filter(|window| window.name != "status")
-        .collect();
-    let session_drained = remaining.is_empty();
+        .iter()
+        .all(|window| window.name == "status");
     if session_drained {
         eprintln!("Session is empty.");
     }
@@ -398,10 +400,28 @@ fn cmd_session_ls_windows() -> Result<()> {
         return Ok(());
     };
 
-    for (_, info) in sorted_windows_sessions(&state) {
-        let tmux = TmuxManager::new(&info.session_name);
-        let attached = tmux.is_attached().unwrap_or(false);
-        let agent_status = agent_window_status(&tmux);
+    // Each session needs its own tmux round trips, so query them all at once
+    // rather than paying the latency once per session.
+    let entries = sorted_windows_sessions(&state);
+    let statuses: Vec<(bool, AgentStatus)> = std::thread::scope(|scope| {
+        let handles: Vec<_> = entries
+            .iter()
+            .map(|(_, info)| {
+                scope.spawn(move || {
+                    let tmux = TmuxManager::new(&info.session_name);
+                    let attached = tmux.is_attached().unwrap_or(false);
+                    (attached, agent_window_status(&tmux))
+                })
+            })
+            .collect();
+
+        handles
+            .into_iter()
+            .map(|handle| handle.join().unwrap_or((false, AgentStatus::Unknown)))
+            .collect()
+    });
+
+    for ((_, info), (attached, agent_status)) in entries.iter().zip(statuses) {
         let marker = if attached { "*" } else { " " };
         println!("{} {} (agent: {})", marker, info.session_name, agent_status);
     }
@@ -410,17 +430,14 @@ fn cmd_session_ls_windows() -> Result<()> {
 }
 
 fn cmd_session_rm_windows(context: &SessionCmdContext<'_>, name: &str) -> Result<()> {
-    let probe = probe_session_rm(context, name)?;
     let mut state = SessionState::load()?;
 
-    let session_name = state
-        .as_ref()
-        .and_then(|loaded| loaded.windows_sessions.get(name))
-        .map(|info| info.session_name.clone())
-        .unwrap_or_else(|| context.config.session.session_name_for(name));
+    // The probe already resolved the session name and checked it is live
+    let probe = probe_session_rm(context, name, state.as_ref())?;
+    let session_name = probe.windows_session_name.clone();
+    let session_existed = probe.windows_session_live;
 
     let tmux = TmuxManager::new(&session_name);
-    let session_existed = tmux.session_exists()?;
 
     if session_existed {
         tmux.kill_session()?;
@@ -467,43 +484,73 @@ fn cmd_session_watch(tmux: &TmuxManager, interval: u64) -> Result<()> {
     }
 
     let interval_duration = std::time::Duration::from_secs(interval);
+    let mut last_frame = String::new();
 
     loop {
-        print!("\x1B[2J\x1B[H");
-        std::io::stdout().flush()?;
-
-        println!("wt session status (refresh: {}s)\n", interval);
-
         let windows = tmux.list_windows()?;
-        let worktrees: Vec<_> = windows
-            .iter()
-            .filter(|window| window.name != "status")
-            .collect();
 
-        if worktrees.is_empty() {
-            println!("  No worktrees in session.");
-        } else {
-            for window in &worktrees {
-                let status_icon = match window.agent_status {
-                    AgentStatus::Active => "\x1B[32m●\x1B[0m",
-                    AgentStatus::Idle => "\x1B[90m○\x1B[0m",
-                    AgentStatus::Unknown => "\x1B[33m?\x1B[0m",
-                };
-                let active_marker = if window.active { " ←" } else { "" };
-                println!(
-                    "  {} [{}] {}{} ({} panes)",
-                    status_icon, window.index, window.name, active_marker, window.pane_count
-                );
-            }
+        // list_windows reports a vanished session as no windows; only then
+        // pay for the has-session check, and stop instead of polling forever
+        if windows.is_empty() && !tmux.session_exists()? {
+            eprintln!("Session ended.");
+            return Ok(());
         }
 
-        println!("\n\x1B[90m● active  ○ idle  ? unknown\x1B[0m");
-        println!("\x1B[90mPress Ctrl+C to exit\x1B[0m");
+        let frame = render_watch_frame(interval, &windows);
+
+        // Repaint in place, and only when something changed: home the cursor,
+        // overwrite the lines (each clears its own tail) and clear whatever
+        // is left below, all in one write. Avoids the full-screen clear and
+        // the flicker that came with it.
+        if frame != last_frame {
+            let mut stdout = std::io::stdout().lock();
+            write!(stdout, "\x1B[H{}\x1B[J", frame)?;
+            stdout.flush()?;
+            last_frame = frame;
+        }
 
         std::thread::sleep(interval_duration);
     }
 }
 
+fn render_watch_frame(interval: u64, windows: &[TmuxWindow]) -> String {
+    let mut lines = vec![
+        format!("wt session status (refresh: {}s)", interval),
+        String::new(),
+    ];
+
+    let worktrees: Vec<_> = windows
+        .iter()
+        .filter(|window| window.name != "status")
+        .collect();
+
+    if worktrees.is_empty() {
+        lines.push("  No worktrees in session.".to_string());
+    } else {
+        for window in &worktrees {
+            let status_icon = match window.agent_status {
+                AgentStatus::Active => "\x1B[32m●\x1B[0m",
+                AgentStatus::Idle => "\x1B[90m○\x1B[0m",
+                AgentStatus::Unknown => "\x1B[33m?\x1B[0m",
+            };
+            let active_marker = if window.active { " ←" } else { "" };
+            lines.push(format!(
+                "  {} [{}] {}{} ({} panes)",
+                status_icon, window.index, window.name, active_marker, window.pane_count
+            ));
+        }
+    }
+
+    lines.push(String::new());
+    lines.push("\x1B[90m● active  ○ idle  ? unknown\x1B[0m".to_string());
+    lines.push("\x1B[90mPress Ctrl+C to exit\x1B[0m".to_string());
+
+    lines
+        .iter()
+        .map(|line| format!("{}\x1B[K\n", line))
+        .collect()
+}
+
 fn persist_windows_session(
     worktree_name: &str,
     session_name: &str,
@@ -529,8 +576,11 @@ fn load_windows_state() -> Result<Option<SessionState>> {
         return Ok(None);
     };
 
-    prune_windows_state(&mut state);
-    save_state_or_clear_if_empty(&state)?;
+    // Read-only callers shouldn't rewrite sessions.json when nothing was
+    // pruned
+    if prune_windows_state(&mut state) || state.is_empty() {
+        save_state_or_clear_if_empty(&state)?;
+    }
     Ok(Some(state))
 }
 
@@ -548,10 +598,16 @@ fn load_windows_state_or_report_empty() -> Result<Option<SessionState>> {
     Ok(Some(state))
 }
 
-fn prune_windows_state(state: &mut SessionState) {
-    if let Ok(live) = TmuxManager::live_session_names() {
-        retain_live_sessions(&mut state.windows_sessions, &live);
-    }
+/// Drop windows-mode entries whose session is gone. Returns whether any
+/// entry was removed.
+fn prune_windows_state(state: &mut SessionState) -> bool {
+    let Ok(live) = TmuxManager::live_session_names() else {
+        return false;
+    };
+
+    let before = state.windows_sessions.len();
+    retain_live_sessions(&mut state.windows_sessions, &live);
+    state.windows_sessions.len() != before
 }
 
 fn save_state_or_clear_if_empty(state: &SessionState) -> Result<()> {
@@ -564,7 +620,9 @@ fn save_state_or_clear_if_empty(state: &SessionState) -> Result<()> {
 
 fn sorted_windows_sessions(state: &SessionState) -> Vec<(&String, &WindowsSessionInfo)> {
     let mut entries: Vec<_> = state.windows_sessions.iter().collect();
-    entries.sort_by(|left, right| left.1.session_name.cmp(&right.1.session_name));
+    // HashMap iteration has no order to preserve, so a stable sort buys
+    // nothing
+    entries.sort_unstable_by(|left, right| left.1.session_name.cmp(&right.1.session_name));
     entries
 }
 
@@ -584,7 +642,11 @@ fn agent_window_status(tmux: &TmuxManager) -> AgentStatus {
         .unwrap_or(AgentStatus::Unknown)
 }
 
-fn probe_session_rm(context: &SessionCmdContext<'_>, name: &str) -> Result<SessionRmProbe> {
+fn probe_session_rm(
+    context: &SessionCmdContext<'_>,
+    name: &str,
+    state: Option<&SessionState>,
+) -> Result<SessionRmProbe> {
     let manager = WorktreeManager::new(context.repo.root.clone())?;
     let panes_tmux = TmuxManager::new(SESSION_NAME);
     let panes_has_worktree = if panes_tmux.session_exists()? {
@@ -596,9 +658,7 @@ fn probe_session_rm(context: &SessionCmdContext<'_>, name: &str) -> Result<Sessi
         false
     };
 
-    let state = SessionState::load()?;
     let tracked_windows_session_name = state
-        .as_ref()
         .and_then(|loaded| loaded.windows_sessions.get(name))
         .map(|info| info.session_name.clone());
     let windows_session_tracked = tracked_windows_session_name.is_some();
@@ -742,6 +802,37 @@ mod tests {
         assert_eq!(windows_rm_hint("demo", &probe()), None);
     }
 
+    fn window(index: u32, name: &str, agent_status: AgentStatus) -> TmuxWindow {
+        TmuxWindow {
+            index,
+            name: name.to_string(),
+            pane_count: 2,
+            active: false,
+            agent_status,
+        }
+    }
+
+    #[test]
+    fn test_render_watch_frame_skips_status_window() {
+        let windows = vec![
+            window(0, "status", AgentStatus::Active),
+            window(1, "feature", AgentStatus::Idle),
+        ];
+
+        let frame = render_watch_frame(2, &windows);
+
+        assert!(frame.starts_with("wt session status (refresh: 2s)\x1B[K\n"));
+        assert!(frame.contains("[1] feature (2 panes)"));
+        assert!(!frame.contains("status (2 panes)"));
+        assert!(frame.lines().all(|line| line.ends_with("\x1B[K")));
+    }
+
+    #[test]
+    fn test_render_watch_frame_reports_empty_session() {
+        let frame = render_watch_frame(2, &[window(0, "status", AgentStatus::Active)]);
+        assert!(frame.contains("  No worktrees in session.\x1B[K\n"));
+    }
+
     #[test]
     fn test_windows_layout_names_match_pane_count() {
         assert_eq!(
@@ -1,6 +1,7 @@
 use anyhow::{Context, Result};
+use std::io::{BufRead, BufReader};
 use std::path::{Path, PathBuf};
-use std::process::Command;
+use std::process::{Command, Stdio};
 
 pub fn spawn_wt_shell(wt_path: &Path, wt_name: &str, branch: &str) -> Result<()> {
     if std::env::var("WT_ACTIVE").is_ok() {
@@ -81,7 +82,13 @@ fn spawn_fish(shell_path: &str, wt_path: &Path, wt_name: &str, branch: &str) ->
 
 fn create_zsh_wrapper() -> Result<PathBuf> {
     let temp_dir = std::env::temp_dir().join(format!("wt-zsh-{}", std::process::id()));
-    std::fs::create_dir_all(&temp_dir)?;
+    write_zsh_wrapper(&temp_dir)?;
+    Ok(temp_dir)
+}
+
+/// Write the wrapper ZDOTDIR contents into `temp_dir`.
+fn write_zsh_wrapper(temp_dir: &Path) -> Result<()> {
+    std::fs::create_dir_all(temp_dir)?;
     let functions_dir = temp_dir.join("functions");
     std::fs::create_dir_all(&functions_dir)?;
 
@@ -141,24 +148,37 @@ compdef() {
 
     std::fs::write(temp_dir.join(".zshenv"), zshenv_content)?;
     std::fs::write(functions_dir.join("compdef"), compdef_content)?;
-    Ok(temp_dir)
+    Ok(())
 }
 
 fn show_exit_status(wt_path: &Path) -> Result<()> {
     eprintln!("\n--- Exiting wt shell ---");
 
-    let output = Command::new("git")
+    // Relay status lines as git produces them rather than buffering the
+    // whole listing, which can be large in a busy worktree.
+    let mut child = Command::new("git")
         .args(["status", "--short"])
         .current_dir(wt_path)
-        .output()
+        .stdout(Stdio::piped())
+        .stderr(Stdio::null())
+        .spawn()
         .context("Failed to get git status")?;
 
-    let status = String::from_utf8_lossy(&output.stdout);
-    if status.is_empty() {
+    let mut clean = true;
+    if let Some(stdout) = child.stdout.take() {
+        for line in BufReader::new(stdout).split(b'\n') {
+            let line = line.context("Failed to read git status")?;
+            if clean {
+                eprintln!("Uncommitted changes:");
+                clean = false;
+            }
+            eprintln!("{}", String::from_utf8_lossy(&line));
+        }
+    }
+    child.wait().context("Failed to get git status")?;
+
+    if clean {
         eprintln!("Working tree clean.");
-    } else {
-        eprintln!("Uncommitted changes:");
-        eprint!("{}", status);
     }
 
     Ok(())
@@ -166,7 +186,7 @@ fn show_exit_status(wt_path: &Path) -> Result<()> {
 
 #[cfg(test)]
 mod tests {
-    use super::create_zsh_wrapper;
+    use super::write_zsh_wrapper;
     use std::fs;
     use std::process::Command;
 
@@ -180,15 +200,16 @@ mod tests {
 
     #[test]
     fn zsh_wrapper_sources_startup_files_from_original_dotdir() {
-        let temp_dir = create_zsh_wrapper().expect("create zsh wrapper");
-        let zshenv = std::fs::read_to_string(temp_dir.join(".zshenv")).expect("read zshenv");
+        // Each test gets its own wrapper dir; the per-process path the
+        // shell uses would be shared by tests running in parallel
+        let temp_dir = tempfile::TempDir::new().expect("create wrapper dir");
+        write_zsh_wrapper(temp_dir.path()).expect("create zsh wrapper");
+        let zshenv = std::fs::read_to_string(temp_dir.path().join(".zshenv")).expect("read zshenv");
 
         assert!(zshenv.contains("export ZDOTDIR=\"$_WT_ORIG_ZDOTDIR\""));
         assert!(zshenv.contains("fpath=(\"$ZDOTDIR/functions\" $fpath)"));
-        assert!(temp_dir.join("functions").join("compdef").exists());
-        assert!(!temp_dir.join(".zshrc").exists());
-
-        let _ = std::fs::remove_dir_all(temp_dir);
+        assert!(temp_dir.path().join("functions").join("compdef").exists());
+        assert!(!temp_dir.path().join(".zshrc").exists());
     }
 
     #[test]
@@ -208,13 +229,14 @@ PROMPT="demo ❯❯❯ "
         )
         .expect("write fake zshrc");
 
-        let wrapper_dir = create_zsh_wrapper().expect("create zsh wrapper");
+        let wrapper_dir = tempfile::TempDir::new().expect("create wrapper dir");
+        write_zsh_wrapper(wrapper_dir.path()).expect("create zsh wrapper");
 
         let output = Command::new("zsh")
             .arg("-ic")
             .arg("print -r -- \"${(j:,:)precmd_functions}\"; _wt_apply_prompt_prefix; print -r -- \"$PROMPT\"")
             .env("HOME", home_dir.path())
-            .env("ZDOTDIR", &wrapper_dir)
+            .env("ZDOTDIR", wrapper_dir.path())
             .env("_WT_ORIG_ZDOTDIR", home_dir.path())
             .output()
             .expect("run zsh startup");
@@ -230,7 +252,5 @@ PROMPT="demo ❯❯❯ "
         let stdout = String::from_utf8_lossy(&output.stdout);
         assert!(stdout.contains("_wt_apply_prompt_prefix"));
         assert!(stdout.contains("(wt) demo ❯❯❯ "));
-
-        let _ = fs::remove_dir_all(wrapper_dir);
     }
 }
@@ -1,7 +1,7 @@
 use anyhow::{Context, Result};
 use std::collections::HashSet;
 use std::path::Path;
-use std::process::Command;
+use std::process::{Command, Stdio};
 
 use crate::config::SessionConfig;
 
@@ -19,7 +19,7 @@ pub struct TmuxWindow {
     pub agent_status: AgentStatus,
 }
 
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
 pub enum AgentStatus {
     Idle,
     Active,
@@ -36,6 +36,84 @@ impl std::fmt::Display for AgentStatus {
     }
 }
 
+fn is_executable(path: &Path) -> bool {
+    match path.metadata() {
+        #[cfg(unix)]
+        Ok(metadata) => {
+            use std::os::unix::fs::PermissionsExt;
+            metadata.is_file() && metadata.permissions().mode() & 0o111 != 0
+        }
+        #[cfg(not(unix))]
+        Ok(metadata) => metadata.is_file(),
+        Err(_) => false,
+    }
+}
+
+/// Classify the command running in a window's agent pane.
+fn agent_status_for_command(cmd: &str) -> AgentStatus {
+    match cmd {
+        "bash" | "zsh" | "sh" | "fish" | "ksh" | "tcsh" | "dash" => AgentStatus::Idle,
+        "" => AgentStatus::Unknown,
+        _ => AgentStatus::Active,
+    }
+}
+
+/// Fold `list-panes -s` rows (one per pane, grouped by window) into
+/// windows, taking the agent status from pane 0.
+fn parse_pane_rows(stdout: &str) -> Vec<TmuxWindow> {
+    let mut windows: Vec<TmuxWindow> = Vec::new();
+
+    for line in stdout.lines() {
+        // Destructure the fields in place instead of collecting each row
+        let mut fields = line.split('|');
+        let (
+            Some(index),
+            Some(name),
+            Some(pane_count),
+            Some(active),
+            Some(pane_index),
+            Some(command),
+            None,
+        ) = (
+            fields.next(),
+            fields.next(),
+            fields.next(),
+            fields.next(),
+            fields.next(),
+            fields.next(),
+            fields.next(),
+        )
+        else {
+            continue;
+        };
+
+        let Ok(index) = index.parse() else {
+            continue;
+        };
+
+        if windows.last().map(|window| window.index) != Some(index) {
+            let Ok(pane_count) = pane_count.parse() else {
+                continue;
+            };
+            windows.push(TmuxWindow {
+                index,
+                name: name.to_string(),
+                pane_count,
+                active: active == "1",
+                agent_status: AgentStatus::Unknown,
+            });
+        }
+
+        if pane_index == "0" {
+            if let Some(window) = windows.last_mut() {
+                window.agent_status = agent_status_for_command(command.trim());
+            }
+        }
+    }
+
+    windows
+}
+
 impl TmuxManager {
     pub fn new(session_name: &str) -> Self {
         Self {
@@ -44,11 +122,12 @@ impl TmuxManager {
     }
 
     /// Check if tmux is available on the system.
+    ///
+    /// Looks for a `tmux` executable on `PATH` rather than spawning
+    /// `tmux -V`, so the check costs a few stats instead of a process.
     pub fn is_available() -> bool {
-        Command::new("tmux")
-            .arg("-V")
-            .output()
-            .map(|output| output.status.success())
+        std::env::var_os("PATH")
+            .map(|path| std::env::split_paths(&path).any(|dir| is_executable(&dir.join("tmux"))))
             .unwrap_or(false)
     }
 
@@ -78,12 +157,14 @@ impl TmuxManager {
 
     /// Check if the session already exists.
     pub fn session_exists(&self) -> Result<bool> {
-        let output = Command::new("tmux")
+        let status = Command::new("tmux")
             .args(["has-session", "-t", &self.session_name])
-            .output()
+            .stdout(Stdio::null())
+            .stderr(Stdio::null())
+            .status()
             .context("Failed to check tmux session")?;
 
-        Ok(output.status.success())
+        Ok(status.success())
     }
 
     /// Whether a client is currently attached to this session.
@@ -278,14 +359,18 @@ impl TmuxManager {
     }
 
     /// List all windows in the session.
+    ///
+    /// Window metadata and each agent pane's command come from a single
+    /// `list-panes -s` call, so one tmux round trip covers every window.
     pub fn list_windows(&self) -> Result<Vec<TmuxWindow>> {
         let output = Command::new("tmux")
             .args([
-                "list-windows",
+                "list-panes",
+                "-s",
                 "-t",
                 &self.session_name,
                 "-F",
-                "#{window_index}|#{window_name}|#{window_panes}|#{window_active}",
+                "#{window_index}|#{window_name}|#{window_panes}|#{window_active}|#{pane_index}|#{pane_current_command}",
             ])
             .output()
             .context("Failed to list tmux windows")?;
@@ -294,58 +379,7 @@ impl TmuxManager {
             return Ok(vec![]);
         }
 
-        let stdout = String::from_utf8_lossy(&output.stdout);
-        let windows = stdout
-            .lines()
-            .filter_map(|line| {
-                let parts: Vec<&str> = line.split('|').collect();
-                if parts.len() != 4 {
-                    return None;
-                }
-
-                let name = parts[1].to_string();
-                let agent_status = self.get_agent_status(&name).unwrap_or(AgentStatus::Unknown);
-
-                Some(TmuxWindow {
-                    index: parts[0].parse().ok()?,
-                    name,
-                    pane_count: parts[2].parse().ok()?,
-                    active: parts[3] == "1",
-                    agent_status,
-                })
-            })
-            .collect();
-
-        Ok(windows)
-    }
-
-    /// Get the agent status for a window (checks pane 0).
-    fn get_agent_status(&self, window: &str) -> Result<AgentStatus> {
-        let target = format!("{}:{}.0", self.session_name, window);
-        let output = Command::new("tmux")
-            .args([
-                "display-message",
-                "-t",
-                &target,
-                "-p",
-                "#{pane_current_command}",
-            ])
-            .output()
-            .context("Failed to get pane command")?;
-
-        if !output.status.success() {
-            return Ok(AgentStatus::Unknown);
-        }
-
-        let cmd = String::from_utf8_lossy(&output.stdout).trim().to_string();
-        let shells = ["bash", "zsh", "sh", "fish", "ksh", "tcsh", "dash"];
-        if shells.iter().any(|shell| cmd == *shell) {
-            Ok(AgentStatus::Idle)
-        } else if cmd.is_empty() {
-            Ok(AgentStatus::Unknown)
-        } else {
-            Ok(AgentStatus::Active)
-        }
+        Ok(parse_pane_rows(&String::from_utf8_lossy(&output.stdout)))
     }
 
     /// Split the current pane horizontally (left/right).
@@ -442,16 +476,17 @@ impl TmuxManager {
         panes: u8,
         config: &SessionConfig,
     ) -> Result<()> {
+        // Start the agent before splitting so its startup overlaps the
+        // remaining layout calls. The original pane stays at index 0.
+        self.send_keys(window, 0, &config.agent_cmd)?;
         self.split_window_horizontal(window, cwd)?;
 
         if panes == 3 {
             self.select_pane(window, 0)?;
             self.split_window_vertical(window, cwd)?;
-            self.send_keys(window, 0, &config.agent_cmd)?;
             self.send_keys(window, 1, &config.editor_cmd)?;
             self.select_pane(window, 2)?;
         } else {
-            self.send_keys(window, 0, &config.agent_cmd)?;
             self.select_pane(window, 1)?;
         }
 
@@ -493,12 +528,64 @@ mod tests {
         assert!(available || !available);
     }
 
+    #[test]
+    fn test_is_executable() {
+        let dir = tempfile::TempDir::new().unwrap();
+        let script = dir.path().join("tmux");
+        std::fs::write(&script, "#!/bin/sh\n").unwrap();
+        assert!(!is_executable(dir.path()));
+
+        #[cfg(unix)]
+        {
+            use std::os::unix::fs::PermissionsExt;
+            assert!(!is_executable(&script));
+            std::fs::set_permissions(&script, std::fs::Permissions::from_mode(0o755)).unwrap();
+        }
+        assert!(is_executable(&script));
+    }
+
     #[test]
     fn test_manager_creation() {
         let manager = TmuxManager::new("test-session");
         assert_eq!(manager.session_name(), "test-session");
     }
 
+    #[test]
+    fn test_parse_pane_rows_groups_panes_by_window() {
+        let rows = "0|status|1|0|0|wt\n\
+                    1|feature|3|1|0|claude\n\
+                    1|feature|3|1|1|nvim\n\
+                    1|feature|3|1|2|zsh\n\
+                    2|bugfix|2|0|0|bash\n\
+                    2|bugfix|2|0|1|bash\n";
+
+        let windows = parse_pane_rows(rows);
+
+        assert_eq!(windows.len(), 3);
+        assert_eq!(windows[1].index, 1);
+        assert_eq!(windows[1].name, "feature");
+        assert_eq!(windows[1].pane_count, 3);
+        assert!(windows[1].active);
+        assert_eq!(windows[1].agent_status, AgentStatus::Active);
+        assert_eq!(windows[2].agent_status, AgentStatus::Idle);
+    }
+
+    #[test]
+    fn test_parse_pane_rows_without_pane_zero_is_unknown() {
+        let windows = parse_pane_rows("3|feature|1|0|1|claude\n");
+
+        assert_eq!(windows.len(), 1);
+        assert_eq!(windows[0].agent_status, AgentStatus::Unknown);
+    }
+
+    #[test]
+    fn test_agent_status_for_command() {
+        assert_eq!(agent_status_for_command("zsh"), AgentStatus::Idle);
+        assert_eq!(agent_status_for_command("dash"), AgentStatus::Idle);
+        assert_eq!(agent_status_for_command(""), AgentStatus::Unknown);
+        assert_eq!(agent_status_for_command("claude"), AgentStatus::Active);
+    }
+
     #[test]
     fn test_next_window_target_uses_next_free_index_syntax() {
         let manager = TmuxManager::new("wt");
@@ -1,8 +1,8 @@
 use anyhow::{Context, Result};
 use std::fs::{self, OpenOptions};
-use std::io::Write;
+use std::io::{ErrorKind, Write};
 use std::path::{Path, PathBuf};
-use std::process::Command;
+use std::process::{Command, Stdio};
 
 fn sanitize_for_path(name: &str) -> String {
     name.replace('/', "--")
@@ -70,24 +70,14 @@ pub fn ensure_worktrees_in_gitignore(repo_path: &Path, worktree_dir: &Path) -> R
         .and_then(|p| p.to_str())
         .unwrap_or(".worktrees");
 
-    if gitignore_path.exists() {
-        let content = fs::read_to_string(&gitignore_path).context("Failed to read .gitignore")?;
-
-        if content.lines().any(|line| line.trim() == pattern) {
-            return Ok(());
-        }
-
-        let mut file = OpenOptions::new()
-            .append(true)
-            .open(&gitignore_path)
-            .context("Failed to open .gitignore")?;
-
-        if !content.is_empty() && !content.ends_with('\n') {
-            file.write_all(b"\n")
-                .context("Failed to write newline to .gitignore")?;
-        }
+    // A missing .gitignore reads as empty; no separate exists() check
+    let content = match fs::read_to_string(&gitignore_path) {
+        Ok(content) => content,
+        Err(err) if err.kind() == ErrorKind::NotFound => String::new(),
+        Err(err) => return Err(err).context("Failed to read .gitignore"),
+    };
 
-        writeln!(file, "{}", pattern).context("Failed to write to .gitignore")?;
+    if content.lines().any(|line| line.trim() == pattern) {
         return Ok(());
     }
 
@@ -97,6 +87,11 @@ pub fn ensure_worktrees_in_gitignore(repo_path: &Path, worktree_dir: &Path) -> R
         .open(&gitignore_path)
         .context("Failed to open .gitignore")?;
 
+    if !content.is_empty() && !content.ends_with('\n') {
+        file.write_all(b"\n")
+            .context("Failed to write newline to .gitignore")?;
+    }
+
     writeln!(file, "{}", pattern).context("Failed to write to .gitignore")?;
 
     Ok(())
@@ -118,9 +113,8 @@ pub fn check_not_in_worktree(path: &Path) -> Result<()> {
 }
 
 pub fn get_current_worktree_name(path: &Path) -> Result<String> {
-    let output = Command::new("git")
+    let output = git_command(path)
         .args(["rev-parse", "--git-dir"])
-        .current_dir(path)
         .output()
         .context("Failed to execute git rev-parse")?;
 
@@ -145,6 +139,18 @@ pub struct WorktreeInfo {
     pub branch: String,
 }
 
+/// A git command run in `cwd` that can never stop to prompt: stdin is
+/// closed, terminal prompts are disabled and optional locks are skipped.
+fn git_command(cwd: &Path) -> Command {
+    let mut command = Command::new("git");
+    command
+        .current_dir(cwd)
+        .stdin(Stdio::null())
+        .env("GIT_TERMINAL_PROMPT", "0")
+        .env("GIT_OPTIONAL_LOCKS", "0");
+    command
+}
+
 pub struct WorktreeManager {
     repo_path: PathBuf,
 }
@@ -157,6 +163,10 @@ impl WorktreeManager {
         Ok(Self { repo_path })
     }
 
+    fn git(&self) -> Command {
+        git_command(&self.repo_path)
+    }
+
     pub fn create_worktree(
         &self,
         task_id: &str,
@@ -172,49 +182,42 @@ impl WorktreeManager {
             anyhow::bail!("Worktree path already exists: {:?}", worktree_path);
         }
 
-        let mut upstream_branch: Option<String> = None;
-        let output = if self.local_branch_exists(task_id) {
+        let (local_exists, remote_branches) = self.branch_refs(task_id)?;
+
+        let output = if local_exists {
             // Local branch exists, just check it out
-            Command::new("git")
+            self.git()
                 .args(["worktree", "add"])
                 .arg(&worktree_path)
                 .arg(task_id)
-                .current_dir(&self.repo_path)
                 .output()
                 .context("Failed to execute git worktree add")?
         } else {
-            let remote_branches = self.remote_branch_candidates(task_id)?;
-            match remote_branches.as_slice() {
-                [] => Command::new("git")
-                    .args(["worktree", "add", "-b", task_id])
-                    .arg(&worktree_path)
-                    .arg(base_branch)
-                    .current_dir(&self.repo_path)
-                    .output()
-                    .context("Failed to execute git worktree add")?,
-                [remote_branch] => {
-                    upstream_branch = Some(remote_branch.clone());
-                    Command::new("git")
-                        .args(["worktree", "add", "-b", task_id])
-                        .arg(&worktree_path)
-                        .arg(remote_branch)
-                        .current_dir(&self.repo_path)
-                        .output()
-                        .context("Failed to execute git worktree add")?
-                }
-
-                _ => {
-                    let remote_branch = select_remote_branch(&remote_branches)?;
-                    upstream_branch = Some(remote_branch.clone());
-                    Command::new("git")
-                        .args(["worktree", "add", "-b", task_id])
-                        .arg(&worktree_path)
-                        .arg(&remote_branch)
-                        .current_dir(&self.repo_path)
-                        .output()
-                        .context("Failed to execute git worktree add")?
-                }
+            let start_point = match remote_branches.as_slice() {
+                [] => base_branch.to_string(),
+                [remote_branch] => remote_branch.clone(),
+                _ => select_remote_branch(&remote_branches)?,
+            };
+
+            // Set the upstream while creating the branch rather than with a
+            // separate `git branch --set-upstream-to` afterwards
+            let track = !remote_branches.is_empty()
+                && start_point
+                    .split('/')
+                    .next()
+                    .map(|remote_name| self.remote_exists(remote_name))
+                    .unwrap_or(false);
+
+            let mut command = self.git();
+            command.args(["worktree", "add", "-b", task_id]);
+            if track {
+                command.arg("--track");
             }
+            command
+                .arg(&worktree_path)
+                .arg(&start_point)
+                .output()
+                .context("Failed to execute git worktree add")?
         };
 
         if !output.status.success() {
@@ -224,30 +227,10 @@ impl WorktreeManager {
             );
         }
 
-        if let Some(remote_branch) = upstream_branch {
-            if let Some(remote_name) = remote_branch.split('/').next() {
-                if self.remote_exists(remote_name) {
-                    let output = Command::new("git")
-                        .args(["branch", "--set-upstream-to", &remote_branch, task_id])
-                        .current_dir(&self.repo_path)
-                        .output()
-                        .context("Failed to set branch upstream")?;
-
-                    if !output.status.success() {
-                        anyhow::bail!(
-                            "Failed to set branch upstream: {}",
-                            String::from_utf8_lossy(&output.stderr)
-                        );
-                    }
-                }
-            }
-        }
-
         // Set up autoSetupRemote so `git push` works without -u origin HEAD
         // (avoids "upstream is gone" warning before first push)
-        Command::new("git")
+        git_command(&worktree_path)
             .args(["config", "push.autoSetupRemote", "true"])
-            .current_dir(&worktree_path)
             .output()
             .ok();
 
@@ -257,64 +240,64 @@ impl WorktreeManager {
         Ok(worktree_path)
     }
 
-    fn local_branch_exists(&self, branch: &str) -> bool {
-        Command::new("git")
+    /// Whether `branch` exists locally, plus the sorted remote-tracking
+    /// branches with the same name, from a single ref scan.
+    fn branch_refs(&self, branch: &str) -> Result<(bool, Vec<String>)> {
+        let local_ref = format!("refs/heads/{}", branch);
+        let output = self
+            .git()
             .args([
-                "show-ref",
-                "--verify",
-                "--quiet",
-                &format!("refs/heads/{}", branch),
+                "for-each-ref",
+                "--format=%(refname)%09%(refname:short)",
+                &local_ref,
+                "refs/remotes",
             ])
-            .current_dir(&self.repo_path)
-            .output()
-            .map(|o| o.status.success())
-            .unwrap_or(false)
-    }
-
-    fn remote_branch_candidates(&self, branch: &str) -> Result<Vec<String>> {
-        let output = Command::new("git")
-            .args(["for-each-ref", "--format=%(refname:short)", "refs/remotes"])
-            .current_dir(&self.repo_path)
             .output()
             .context("Failed to execute git for-each-ref")?;
 
         if !output.status.success() {
             anyhow::bail!(
-                "Failed to list remote branches: {}",
+                "Failed to list branches: {}",
                 String::from_utf8_lossy(&output.stderr)
             );
         }
 
-        let mut candidates: Vec<String> = String::from_utf8_lossy(&output.stdout)
-            .lines()
-            .map(str::trim)
-            .filter(|refname| !refname.is_empty() && !refname.ends_with("/HEAD"))
-            .filter(|refname| {
-                refname
+        let stdout = String::from_utf8_lossy(&output.stdout);
+        let mut local_exists = false;
+        let mut candidates = Vec::new();
+
+        for (refname, short) in stdout.lines().filter_map(|line| line.split_once('\t')) {
+            if refname == local_ref {
+                local_exists = true;
+            } else if refname.starts_with("refs/remotes/")
+                && !short.ends_with("/HEAD")
+                && short
                     .rsplit_once('/')
                     .map(|(_, leaf)| leaf == branch)
                     .unwrap_or(false)
-            })
-            .map(str::to_string)
-            .collect();
+            {
+                candidates.push(short.to_string());
+            }
+        }
         candidates.sort();
 
-        Ok(candidates)
+        Ok((local_exists, candidates))
     }
 
     fn remote_exists(&self, remote: &str) -> bool {
-        Command::new("git")
+        self.git()
             .args(["config", "--get", &format!("remote.{}.url", remote)])
-            .current_dir(&self.repo_path)
-            .output()
-            .map(|o| o.status.success())
+            .stdout(Stdio::null())
+            .stderr(Stdio::null())
+            .status()
+            .map(|status| status.success())
             .unwrap_or(false)
     }
 
     pub fn list_worktrees(&self) -> Result<Vec<WorktreeInfo>> {
-        let output = Command::new("git")
+        let output = self
+            .git()
             .args(["worktree", "list", "--porcelain"])
-            .current_dir(&self.repo_path)
             .output()
             .context("Failed to execute git worktree list")?;
 
@@ -326,32 +309,31 @@ impl WorktreeManager {
         }
 
         let stdout = String::from_utf8_lossy(&output.stdout);
-        let mut worktrees = Vec::new();
-        let mut current_worktree: Option<(PathBuf, Option<String>)> = None;
+        Ok(self.parse_worktree_list(&stdout))
+    }
 
-        for line in stdout.lines() {
-            if line.starts_with("worktree ") {
-                if let Some((path, branch)) = current_worktree.take() {
-                    worktrees.push(self.parse_worktree_entry(path, branch));
-                }
-                let path = PathBuf::from(line.strip_prefix("worktree ").unwrap());
-                current_worktree = Some((path, None));
-            } else if line.starts_with("branch ") {
-                if let Some((ref _path, ref mut branch)) = current_worktree {
-                    let branch_name = line
-                        .strip_prefix("branch ")
-                        .unwrap()
-                        .trim_start_matches("refs/heads/");
-                    *branch = Some(branch_name.to_string());
+    /// Parse `git worktree list --porcelain` output: one blank-line
+    /// separated record per worktree, each line a `key value` pair.
+    fn parse_worktree_list(&self, porcelain: &str) -> Vec<WorktreeInfo> {
+        porcelain
+            .split("\n\n")
+            .filter_map(|record| {
+                let mut path = None;
+                let mut branch = None;
+
+                for line in record.lines() {
+                    match line.split_once(' ') {
+                        Some(("worktree", value)) => path = Some(PathBuf::from(value)),
+                        Some(("branch", value)) => {
+                            branch = Some(value.trim_start_matches("refs/heads/").to_string())
+                        }
+                        _ => {}
+                    }
                 }
-            }
-        }
 
-        if let Some((path, branch)) = current_worktree {
-            worktrees.push(self.parse_worktree_entry(path, branch));
-        }
-
-        Ok(worktrees)
+                path.map(|path| self.parse_worktree_entry(path, branch))
+            })
+            .collect()
     }
 
     fn parse_worktree_entry(&self, path: PathBuf, branch: Option<String>) -> WorktreeInfo {
@@ -376,28 +358,33 @@ impl WorktreeManager {
             .get_worktree_info(task_id)?
             .ok_or_else(|| anyhow::anyhow!("Worktree '{}' not found", task_id))?;
 
+        self.remove_worktree_entry(&wt_info)
+    }
+
+    /// Remove a worktree already obtained from `list_worktrees`, without
+    /// listing the worktrees again to look it up.
+    pub fn remove_worktree_entry(&self, wt_info: &WorktreeInfo) -> Result<()> {
         // If path doesn't exist on disk, just prune stale entries
         if !wt_info.path.exists() {
-            Command::new("git")
+            self.git()
                 .args(["worktree", "prune"])
-                .current_dir(&self.repo_path)
                 .output()
                 .context("Failed to prune stale worktrees")?;
             return Ok(());
         }
 
-        let output = Command::new("git")
+        let output = self
+            .git()
             .args(["worktree", "remove"])
             .arg(&wt_info.path)
-            .current_dir(&self.repo_path)
             .output()
             .context("Failed to execute git worktree remove")?;
 
         if !output.status.success() {
-            let output_force = Command::new("git")
+            let output_force = self
+                .git()
                 .args(["worktree", "remove", "--force"])
                 .arg(&wt_info.path)
-                .current_dir(&self.repo_path)
                 .output()
                 .context("Failed to execute git worktree remove --force")?;
 
@@ -427,52 +414,140 @@ impl WorktreeManager {
 #[cfg(test)]
 mod tests {
     use super::*;
+    use crate::test_repo::{init_repo_at, test_temp_dir, INITIAL_COMMIT, INIT_ARGS};
     use std::fs;
+    use std::sync::OnceLock;
     use tempfile::TempDir;
 
-    fn setup_git_repo() -> TempDir {
-        let temp_dir = TempDir::new().unwrap();
-        let repo_path = temp_dir.path();
-
-        Command::new("git")
-            .args(&["init", "-b", "main"])
-            .current_dir(repo_path)
-            .output()
+    /// Run a git command whose output the test doesn't read, failing the
+    /// test if git does.
+    fn git(dir: &Path, args: &[&str]) {
+        let status = Command::new("git")
+            .args(args)
+            .current_dir(dir)
+            .stdout(Stdio::null())
+            .stderr(Stdio::null())
+            .status()
             .unwrap();
+        assert!(status.success(), "git {:?} failed", args);
+    }
 
-        Command::new("git")
-            .args(&["config", "user.email", "test@example.com"])
-            .current_dir(repo_path)
-            .output()
-            .unwrap();
+    /// `init_repo_at` leaves the index and work tree empty; the template
+    /// checks `main` out so every copy starts clean.
+    const TEMPLATE_RESET: &[&str] = &["reset", "--hard", "--quiet"];
+
+    /// A one-commit repo that tests copy instead of paying for five git
+    /// processes each. It is cached in the build's own target directory,
+    /// named after a hash of the recipe and the git version, and only reused
+    /// when the current user owns it and its commit is intact.
+    fn template_repo() -> &'static Path {
+        static TEMPLATE: OnceLock<PathBuf> = OnceLock::new();
+
+        TEMPLATE.get_or_init(|| {
+            use std::hash::{Hash, Hasher};
+
+            // target/<profile>/, next to the deps/ dir holding this binary
+            let exe = std::env::current_exe().unwrap();
+            let cache_dir = exe.parent().and_then(Path::parent).unwrap();
+
+            let git_version = Command::new("git").arg("--version").output().unwrap();
+            let mut hasher = std::collections::hash_map::DefaultHasher::new();
+            (INIT_ARGS, INITIAL_COMMIT, TEMPLATE_RESET).hash(&mut hasher);
+            git_version.stdout.hash(&mut hasher);
+            let path = cache_dir.join(format!("wt-test-template-{:016x}", hasher.finish()));
+
+            // Freshly created, so it carries the current user's ownership
+            let staging = tempfile::Builder::new()
+                .prefix("wt-test-template-")
+                .tempdir_in(cache_dir)
+                .unwrap();
+
+            if fs::symlink_metadata(&path).is_ok() {
+                assert!(
+                    same_owner_dir(&path, staging.path()),
+                    "refusing template repo {} not owned by the current user",
+                    path.display()
+                );
+                if template_is_intact(&path) {
+                    return path;
+                }
+                // Move a damaged template aside; staging's cleanup deletes it
+                let _ = fs::rename(&path, staging.path().join("damaged"));
+            }
 
-        Command::new("git")
-            .args(&["config", "user.name", "Test User"])
-            .current_dir(repo_path)
-            .output()
-            .unwrap();
+            let repo_path = staging.path().join("repo");
+            fs::create_dir(&repo_path).unwrap();
+            init_repo_at(&repo_path);
+            git(&repo_path, TEMPLATE_RESET);
+
+            // Publish with an atomic rename. If a concurrent run got there
+            // first the rename fails and its copy is used instead
+            let _ = fs::rename(&repo_path, &path);
+            assert!(
+                same_owner_dir(&path, staging.path()),
+                "failed to publish template repo {}",
+                path.display()
+            );
+            path
+        })
+    }
 
-        fs::write(repo_path.join("README.md"), "# Test Repo\n").unwrap();
+    /// Whether `path` is a real directory (not a symlink) owned by the same
+    /// user as `reference`.
+    fn same_owner_dir(path: &Path, reference: &Path) -> bool {
+        match (fs::symlink_metadata(path), fs::metadata(reference)) {
+            #[cfg(unix)]
+            (Ok(metadata), Ok(reference)) => {
+                use std::os::unix::fs::MetadataExt;
+                metadata.is_dir() && metadata.uid() == reference.uid()
+            }
+            #[cfg(not(unix))]
+            (Ok(metadata), Ok(_)) => metadata.is_dir(),
+            _ => false,
+        }
+    }
 
+    /// Whether the template's commit, tree and README blob are all readable.
+    fn template_is_intact(path: &Path) -> bool {
         Command::new("git")
-            .args(&["add", "."])
-            .current_dir(repo_path)
-            .output()
-            .unwrap();
+            .args(["cat-file", "-e", "main:README.md"])
+            .current_dir(path)
+            .stdout(Stdio::null())
+            .stderr(Stdio::null())
+            .status()
+            .is_ok_and(|status| status.success())
+    }
 
-        Command::new("git")
-            .args(&["commit", "-m", "Initial commit"])
-            .current_dir(repo_path)
-            .output()
-            .unwrap();
+    /// Copy `src` into `dst`. Files under an `objects` directory are
+    /// hardlinked instead: git objects are immutable, so every test repo
+    /// can share the template's object store the way `clone --local` does.
+    fn copy_dir_all(src: &Path, dst: &Path, link: bool) {
+        fs::create_dir_all(dst).unwrap();
+        for entry in fs::read_dir(src).unwrap() {
+            let entry = entry.unwrap();
+            let target = dst.join(entry.file_name());
+            if entry.file_type().unwrap().is_dir() {
+                copy_dir_all(
+                    &entry.path(),
+                    &target,
+                    link || entry.file_name() == "objects",
+                );
+            } else if !link || fs::hard_link(entry.path(), &target).is_err() {
+                fs::copy(entry.path(), &target).unwrap();
+            }
+        }
+    }
 
+    fn setup_git_repo() -> TempDir {
+        let temp_dir = test_temp_dir();
+        copy_dir_all(template_repo(), temp_dir.path(), false);
         temp_dir
     }
 
     #[test]
     fn test_create_worktree() {
         let repo = setup_git_repo();
-        let worktree_dir = TempDir::new().unwrap();
+        let worktree_dir = test_temp_dir();
 
         let manager = WorktreeManager::new(repo.path().to_path_buf()).unwrap();
         let worktree_path = manager
@@ -491,7 +566,7 @@ mod tests {
     #[test]
     fn test_list_worktrees() {
         let repo = setup_git_repo();
-        let worktree_dir = TempDir::new().unwrap();
+        let worktree_dir = test_temp_dir();
 
         let manager = WorktreeManager::new(repo.path().to_path_buf()).unwrap();
         manager
@@ -513,10 +588,33 @@ mod tests {
         assert!(task_ids.contains(&"feature-2".to_string()));
     }
 
+    #[test]
+    fn test_parse_worktree_list_porcelain_records() {
+        let repo = setup_git_repo();
+        let manager = WorktreeManager::new(repo.path().to_path_buf()).unwrap();
+
+        let porcelain = format!(
+            "worktree {}\nHEAD 1111111111111111111111111111111111111111\nbranch refs/heads/main\n\n\
+             worktree /tmp/wts/feature--auth\nHEAD 2222222222222222222222222222222222222222\nbranch refs/heads/feature/auth\nlocked\n\n\
+             worktree /tmp/wts/detached\nHEAD 3333333333333333333333333333333333333333\ndetached\n\n",
+            repo.path().display()
+        );
+
+        let worktrees = manager.parse_worktree_list(&porcelain);
+
+        assert_eq!(worktrees.len(), 3);
+        assert_eq!(worktrees[0].task_id, "");
+        assert_eq!(worktrees[0].branch, "main");
+        assert_eq!(worktrees[1].task_id, "feature/auth");
+        assert_eq!(worktrees[1].branch, "feature/auth");
+        assert_eq!(worktrees[2].task_id, "detached");
+        assert_eq!(worktrees[2].branch, "");
+    }
+
     #[test]
     fn test_remove_worktree() {
         let repo = setup_git_repo();
-        let worktree_dir = TempDir::new().unwrap();
+        let worktree_dir = test_temp_dir();
 
         let manager = WorktreeManager::new(repo.path().to_path_buf()).unwrap();
         let worktree_path = manager
@@ -535,10 +633,37 @@ mod tests {
         assert!(!worktree_path.exists());
     }
 
+    #[test]
+    fn test_remove_worktree_entry_from_listing() {
+        let repo = setup_git_repo();
+        let worktree_dir = test_temp_dir();
+
+        let manager = WorktreeManager::new(repo.path().to_path_buf()).unwrap();
+        let worktree_path = manager
+            .create_worktree(
+                "test-feature",
+                "main",
+                worktree_dir.path(),
+                |_| unreachable!(),
+            )
+            .unwrap();
+
+        let info = manager
+            .list_worktrees()
+            .unwrap()
+            .into_iter()
+            .find(|w| w.task_id == "test-feature")
+            .unwrap();
+        manager.remove_worktree_entry(&info).unwrap();
+
+        assert!(!worktree_path.exists());
+        assert!(!manager.worktree_exists("test-feature"));
+    }
+
     #[test]
     fn test_worktree_exists() {
         let repo = setup_git_repo();
-        let worktree_dir = TempDir::new().unwrap();
+        let worktree_dir = test_temp_dir();
 
         let manager = WorktreeManager::new(repo.path().to_path_buf()).unwrap();
 
@@ -559,7 +684,7 @@ mod tests {
     #[test]
     fn test_get_worktree_info() {
         let repo = setup_git_repo();
-        let worktree_dir = TempDir::new().unwrap();
+        let worktree_dir = test_temp_dir();
 
         let manager = WorktreeManager::new(repo.path().to_path_buf()).unwrap();
         manager
@@ -582,7 +707,7 @@ mod tests {
     #[test]
     fn test_create_duplicate_worktree_fails() {
         let repo = setup_git_repo();
-        let worktree_dir = TempDir::new().unwrap();
+        let worktree_dir = test_temp_dir();
 
         let manager = WorktreeManager::new(repo.path().to_path_buf()).unwrap();
         manager
@@ -615,7 +740,7 @@ mod tests {
     #[test]
     fn test_invalid_base_branch() {
         let repo = setup_git_repo();
-        let worktree_dir = TempDir::new().unwrap();
+        let worktree_dir = test_temp_dir();
 
         let manager = WorktreeManager::new(repo.path().to_path_buf()).unwrap();
         let result = manager.create_worktree(
@@ -630,14 +755,10 @@ mod tests {
     #[test]
     fn test_create_worktree_for_existing_branch() {
         let repo = setup_git_repo();
-        let worktree_dir = TempDir::new().unwrap();
+        let worktree_dir = test_temp_dir();
 
         // Create a branch first
-        Command::new("git")
-            .args(["branch", "existing-feature"])
-            .current_dir(repo.path())
-            .output()
-            .unwrap();
+        git(repo.path(), &["branch", "existing-feature"]);
 
         let manager = WorktreeManager::new(repo.path().to_path_buf()).unwrap();
         let worktree_path = manager
@@ -665,7 +786,7 @@ mod tests {
     #[test]
     fn test_create_worktree_for_remote_branch() {
         let repo = setup_git_repo();
-        let worktree_dir = TempDir::new().unwrap();
+        let worktree_dir = test_temp_dir();
 
         let head = Command::new("git")
             .args(["rev-parse", "HEAD"])
@@ -674,11 +795,10 @@ mod tests {
             .unwrap();
         let commit = String::from_utf8_lossy(&head.stdout).trim().to_string();
 
-        Command::new("git")
-            .args(["update-ref", "refs/remotes/origin/remote-feature", &commit])
-            .current_dir(repo.path())
-            .output()
-            .unwrap();
+        git(
+            repo.path(),
+            &["update-ref", "refs/remotes/origin/remote-feature", &commit],
+        );
 
         let manager = WorktreeManager::new(repo.path().to_path_buf()).unwrap();
         let worktree_path = manager
@@ -702,9 +822,9 @@ mod tests {
     }
 
     #[test]
-    fn test_create_worktree_prompts_for_ambiguous_remote_branch() {
+    fn test_create_worktree_tracks_configured_remote() {
         let repo = setup_git_repo();
-        let worktree_dir = TempDir::new().unwrap();
+        let worktree_dir = test_temp_dir();
 
         let head = Command::new("git")
             .args(["rev-parse", "HEAD"])
@@ -713,20 +833,58 @@ mod tests {
             .unwrap();
         let commit = String::from_utf8_lossy(&head.stdout).trim().to_string();
 
-        Command::new("git")
-            .args(["update-ref", "refs/remotes/origin/shared-feature", &commit])
+        git(
+            repo.path(),
+            &["remote", "add", "origin", "https://example.com/repo.git"],
+        );
+        git(
+            repo.path(),
+            &["update-ref", "refs/remotes/origin/tracked-feature", &commit],
+        );
+
+        let manager = WorktreeManager::new(repo.path().to_path_buf()).unwrap();
+        manager
+            .create_worktree(
+                "tracked-feature",
+                "main",
+                worktree_dir.path(),
+                |_| unreachable!(),
+            )
+            .unwrap();
+
+        let output = Command::new("git")
+            .args(["rev-parse", "--abbrev-ref", "tracked-feature@{upstream}"])
             .current_dir(repo.path())
             .output()
             .unwrap();
-        Command::new("git")
-            .args([
-                "update-ref",
-                "refs/remotes/upstream/shared-feature",
-                &commit,
-            ])
+        let upstream = String::from_utf8_lossy(&output.stdout);
+        assert_eq!(upstream.trim(), "origin/tracked-feature");
+    }
+
+    #[test]
+    fn test_create_worktree_prompts_for_ambiguous_remote_branch() {
+        let repo = setup_git_repo();
+        let worktree_dir = test_temp_dir();
+
+        let head = Command::new("git")
+            .args(["rev-parse", "HEAD"])
             .current_dir(repo.path())
             .output()
             .unwrap();
+        let commit = String::from_utf8_lossy(&head.stdout).trim().to_string();
+
+        git(
+            repo.path(),
+            &["update-ref", "refs/remotes/origin/shared-feature", &commit],
+        );
+        git(
+            repo.path(),
+            &[
+                "update-ref",
+                "refs/remotes/upstream/shared-feature",
+                &commit,
+            ],
+        );
 
         let manager = WorktreeManager::new(repo.path().to_path_buf()).unwrap();
         let mut seen_candidates = Vec::new();
@@ -757,7 +915,7 @@ mod tests {
     #[test]
     fn test_branch_name_with_slashes() {
         let repo = setup_git_repo();
-        let worktree_dir = TempDir::new().unwrap();
+        let worktree_dir = test_temp_dir();
 
         let manager = WorktreeManager::new(repo.path().to_path_buf()).unwrap();
 
@@ -0,0 +1,13 @@
+//! Fixtures shared by the integration tests.
+
+pub mod repo;
+
+use tempfile::TempDir;
+
+/// Create a repo on `main` with a single commit. These tests never read
+/// the main checkout, so its index and work tree stay empty.
+pub fn setup_git_repo() -> TempDir {
+    let temp_dir = repo::test_temp_dir();
+    repo::init_repo_at(temp_dir.path());
+    temp_dir
+}
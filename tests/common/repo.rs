@@ -0,0 +1,58 @@
+//! Repo fixtures shared by the integration tests and the library's unit
+//! tests, which mount this file directly.
+
+use std::io::Write;
+use std::path::Path;
+use std::process::{Command, Stdio};
+use tempfile::TempDir;
+
+/// `git init` arguments for fixture repos. The empty --template skips
+/// copying sample hooks into .git.
+pub const INIT_ARGS: &[&str] = &["init", "--template=", "-b", "main"];
+
+/// fast-import stream for the fixture repos' single commit on `main`.
+pub const INITIAL_COMMIT: &[u8] = b"commit refs/heads/main\n\
+    committer Test User <test@example.com> 0 +0000\n\
+    data <<EOF\nInitial commit\nEOF\n\
+    M 100644 inline README.md\n\
+    data <<EOF\n# Test Repo\nEOF\n";
+
+/// Test repos churn through many small files; keep them on tmpfs when the
+/// host has one, unless `TMPDIR` explicitly picks somewhere else.
+pub fn test_temp_dir() -> TempDir {
+    let shm = Path::new("/dev/shm");
+    if std::env::var_os("TMPDIR").is_none_or(|dir| dir.is_empty()) && shm.is_dir() {
+        if let Ok(dir) = tempfile::Builder::new().prefix("wt-test-").tempdir_in(shm) {
+            return dir;
+        }
+    }
+    TempDir::new().unwrap()
+}
+
+/// Initialize a repo at `path` holding `INITIAL_COMMIT`. The commit goes
+/// straight into the object store with one fast-import stream: no identity
+/// config, add or commit processes, and no index or work tree updates.
+pub fn init_repo_at(path: &Path) {
+    let init = Command::new("git")
+        .args(INIT_ARGS)
+        .current_dir(path)
+        .stdout(Stdio::null())
+        .stderr(Stdio::null())
+        .status()
+        .unwrap();
+    assert!(init.success());
+
+    let mut import = Command::new("git")
+        .args(["fast-import", "--quiet"])
+        .current_dir(path)
+        .stdin(Stdio::piped())
+        .spawn()
+        .unwrap();
+    import
+        .stdin
+        .take()
+        .unwrap()
+        .write_all(INITIAL_COMMIT)
+        .unwrap();
+    assert!(import.wait().unwrap().success());
+}
@@ -1,3 +1,6 @@
+mod common;
+
+use common::setup_git_repo;
 use std::path::PathBuf;
 use std::process::Command;
 use tempfile::TempDir;
@@ -6,25 +9,6 @@ use wt::config::{Config, SessionConfig};
 use wt::session::SessionState;
 use wt::tmux_manager::TmuxManager;
 
-fn setup_test_repo() -> (TempDir, PathBuf) {
-    let temp_dir = TempDir::new().expect("Failed to create temp dir");
-    let repo_path = temp_dir.path().to_path_buf();
-
-    Command::new("git")
-        .args(["init", "-b", "main"])
-        .current_dir(&repo_path)
-        .output()
-        .expect("Failed to init git repo");
-
-    Command::new("git")
-        .args(["commit", "--allow-empty", "-m", "init"])
-        .current_dir(&repo_path)
-        .output()
-        .expect("Failed to create initial commit");
-
-    (temp_dir, repo_path)
-}
-
 fn kill_tmux_session(session_name: &str) {
     let _ = Command::new("tmux")
         .args(["kill-session", "-t", session_name])
@@ -41,14 +25,15 @@ fn test_tmux_session_lifecycle() {
 
     let session_name = "wt-test-session";
     let tmux = TmuxManager::new(session_name);
-    let (_temp_dir, repo_path) = setup_test_repo();
+    let repo = setup_git_repo();
+    let repo_path = repo.path();
 
     // Cleanup any existing test session
     kill_tmux_session(session_name);
 
     // Test session creation
     assert!(!tmux.session_exists().unwrap());
-    tmux.create_session("test-window", &repo_path).unwrap();
+    tmux.create_session("test-window", repo_path).unwrap();
     assert!(tmux.session_exists().unwrap());
 
     // Test window listing
@@ -57,7 +42,7 @@ fn test_tmux_session_lifecycle() {
     assert_eq!(windows[0].name, "test-window");
 
     // Test window creation
-    tmux.create_window("second-window", &repo_path).unwrap();
+    tmux.create_window("second-window", repo_path).unwrap();
     let windows = tmux.list_windows().unwrap();
     assert_eq!(windows.len(), 2);
 
@@ -80,14 +65,15 @@ fn test_tmux_pane_layout_2_panes() {
 
     let session_name = "wt-test-layout-2";
     let tmux = TmuxManager::new(session_name);
-    let (_temp_dir, repo_path) = setup_test_repo();
+    let repo = setup_git_repo();
+    let repo_path = repo.path();
 
     // Cleanup any existing test session
     kill_tmux_session(session_name);
 
     let config = SessionConfig::default();
-    tmux.create_session("test-window", &repo_path).unwrap();
-    tmux.setup_worktree_layout("test-window", &repo_path, 2, &config)
+    tmux.create_session("test-window", repo_path).unwrap();
+    tmux.setup_worktree_layout("test-window", repo_path, 2, &config)
         .unwrap();
 
     let windows = tmux.list_windows().unwrap();
@@ -107,14 +93,15 @@ fn test_tmux_pane_layout_3_panes() {
 
     let session_name = "wt-test-layout-3";
     let tmux = TmuxManager::new(session_name);
-    let (_temp_dir, repo_path) = setup_test_repo();
+    let repo = setup_git_repo();
+    let repo_path = repo.path();
 
     // Cleanup any existing test session
     kill_tmux_session(session_name);
 
     let config = SessionConfig::default();
-    tmux.create_session("test-window", &repo_path).unwrap();
-    tmux.setup_worktree_layout("test-window", &repo_path, 3, &config)
+    tmux.create_session("test-window", repo_path).unwrap();
+    tmux.setup_worktree_layout("test-window", repo_path, 3, &config)
         .unwrap();
 
     let windows = tmux.list_windows().unwrap();
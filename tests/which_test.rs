@@ -1,46 +1,11 @@
+mod common;
+
+use common::repo::test_temp_dir;
+use common::setup_git_repo;
 use std::fs;
 use std::process::Command;
 use tempfile::TempDir;
 
-fn setup_git_repo() -> TempDir {
-    let temp_dir = TempDir::new().unwrap();
-    let repo_path = temp_dir.path();
-
-    Command::new("git")
-        .args(["init", "-b", "main"])
-        .current_dir(repo_path)
-        .output()
-        .unwrap();
-
-    Command::new("git")
-        .args(["config", "user.email", "test@example.com"])
-        .current_dir(repo_path)
-        .output()
-        .unwrap();
-
-    Command::new("git")
-        .args(["config", "user.name", "Test User"])
-        .current_dir(repo_path)
-        .output()
-        .unwrap();
-
-    std::fs::write(repo_path.join("README.md"), "# Test Repo\n").unwrap();
-
-    Command::new("git")
-        .args(["add", "."])
-        .current_dir(repo_path)
-        .output()
-        .unwrap();
-
-    Command::new("git")
-        .args(["commit", "-m", "Initial commit"])
-        .current_dir(repo_path)
-        .output()
-        .unwrap();
-
-    temp_dir
-}
-
 #[test]
 fn test_which_returns_main_in_main_repo() {
     use wt::worktree_manager::get_current_worktree_name;
@@ -55,7 +20,7 @@ fn test_which_returns_worktree_name_in_worktree() {
     use wt::worktree_manager::get_current_worktree_name;
 
     let repo = setup_git_repo();
-    let worktree_dir = TempDir::new().unwrap();
+    let worktree_dir = test_temp_dir();
     let worktree_path = worktree_dir.path().join("feature-xyz");
 
     let output = Command::new("git")
@@ -89,7 +54,8 @@ fn test_which_fails_outside_git_repo() {
 fn test_ensure_worktrees_in_gitignore_creates_file() {
     use wt::worktree_manager::ensure_worktrees_in_gitignore;
 
-    let repo = setup_git_repo();
+    // Only touches .gitignore, so a plain directory stands in for the repo
+    let repo = TempDir::new().unwrap();
     let gitignore_path = repo.path().join(".gitignore");
     let worktree_dir = repo.path().join(".worktrees");
 
@@ -106,7 +72,7 @@ fn test_ensure_worktrees_in_gitignore_creates_file() {
 fn test_ensure_worktrees_in_gitignore_appends_to_existing() {
     use wt::worktree_manager::ensure_worktrees_in_gitignore;
 
-    let repo = setup_git_repo();
+    let repo = TempDir::new().unwrap();
     let gitignore_path = repo.path().join(".gitignore");
     let worktree_dir = repo.path().join(".worktrees");
 
@@ -123,7 +89,7 @@ fn test_ensure_worktrees_in_gitignore_appends_to_existing() {
 fn test_ensure_worktrees_in_gitignore_adds_newline_when_missing() {
     use wt::worktree_manager::ensure_worktrees_in_gitignore;
 
-    let repo = setup_git_repo();
+    let repo = TempDir::new().unwrap();
     let gitignore_path = repo.path().join(".gitignore");
     let worktree_dir = repo.path().join(".worktrees");
 
@@ -139,7 +105,7 @@ fn test_ensure_worktrees_in_gitignore_adds_newline_when_missing() {
 fn test_ensure_worktrees_in_gitignore_idempotent() {
     use wt::worktree_manager::ensure_worktrees_in_gitignore;
 
-    let repo = setup_git_repo();
+    let repo = TempDir::new().unwrap();
     let gitignore_path = repo.path().join(".gitignore");
     let worktree_dir = repo.path().join(".worktrees");
 